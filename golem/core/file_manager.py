@@ -145,8 +145,8 @@ def new_directory_of_type(project, parents, dir_name, dir_type):
     if dir_type not in ['tests', 'suites', 'pages']:
         errors.append('{} is not a valid dir_type'.format(dir_type))
     else:
-        parents = os.sep.join(parents)
-        path = os.path.join(session.testdir, 'projects', project, dir_type, parents, dir_name)
+        path = os.path.join(session.testdir, 'projects', project, dir_type, *parents,
+                            dir_name)
         if os.path.exists(path):
             errors.append('A directory with that name already exists')
         else:
@@ -6,18 +6,22 @@ import types
 
 from golem.core import file_manager
 from golem.core import parsing_utils
+from golem.core import utils
 from golem.core.project import BaseProjectElement
 from golem.core.project import Project
 from golem.core.project import validate_project_element_name
 
 
+# escape both quote characters in a single pass
+_QUOTE_ESCAPE_TABLE = str.maketrans({'"': '\\"', "'": "\\'"})
+
+
 def create_page(project_name, page_name):
-    errors = []
     project = Project(project_name)
-    if page_name in project.pages():
+    errors = validate_project_element_name(page_name)
+    # a single stat of the page path instead of listing every page
+    if not errors and Page(project_name, page_name).exists:
         errors.append('A page with that name already exists')
-    else:
-        errors = validate_project_element_name(page_name)
     if not errors:
         project.create_packages_for_element(page_name, project.file_types.PAGE)
         with open(Page(project_name, page_name).path, 'w', encoding='utf-8') as f:
@@ -28,7 +32,7 @@ def create_page(project_name, page_name):
 def rename_page(project_name, page_name, new_page_name):
     errors = []
     project = Project(project_name)
-    if page_name not in project.pages():
+    if not Page(project_name, page_name).exists:
         errors.append('Page {} does not exist'.format(page_name))
     else:
         errors = validate_project_element_name(new_page_name)
@@ -66,35 +70,36 @@ def edit_page(project, page_name, elements, functions, import_lines):
         return "\n\n{0} = ('{1}', \'{2}\', '{3}')".format(name, selector, value,
                                                           display_name)
 
+    # build the whole file in memory and write it in a single call
+    content = ['{}\n'.format(line) for line in import_lines]
+    for element in elements:
+        # replace the spaces in web element names with underscores
+        element['name'] = element['name'].replace(' ', '_')
+
+        if element['value']:
+            if element['value'][0] == '\'' and element['value'][-1] == '\'':
+                # remove first and last single quotes if present
+                element['value'] = element['value'][1:-1]
+            elif element['value'].startswith('"""') and element['value'].endswith('"""')\
+                    and len(element['value']) >= 6:
+                # remove first and last triple double quotes if present
+                element['value'] = element['value'][3:-3]
+            elif element['value'][0] == '"' and element['value'][-1] == '"':
+                # remove first and last double quotes if present
+                element['value'] = element['value'][1:-1]
+            # escape quote characters
+            element['value'] = element['value'].translate(_QUOTE_ESCAPE_TABLE)
+
+        if not element['display_name']:
+            element['display_name'] = element['name']
+        formatted = format_element_string(element['name'], element['selector'],
+                                          element['value'], element['display_name'])
+        content.append(formatted)
+    content.extend('\n\n' + func for func in functions)
+
     path = Page(project, page_name).path
     with open(path, 'w', encoding='utf-8') as f:
-        for line in import_lines:
-            f.write("{}\n".format(line))
-        for element in elements:
-            # replace the spaces in web element names with underscores
-            element['name'] = element['name'].replace(' ', '_')
-
-            if element['value']:
-                if element['value'][0] == '\'' and element['value'][-1] == '\'':
-                    # remove first and last single quotes if present
-                    element['value'] = element['value'][1:-1]
-                elif element['value'].startswith('"""') and element['value'].endswith('"""')\
-                        and len(element['value']) >= 6:
-                    # remove first and last triple double quotes if present
-                    element['value'] = element['value'][3:-3]
-                elif element['value'][0] == '"' and element['value'][-1] == '"':
-                    # remove first and last double quotes if present
-                    element['value'] = element['value'][1:-1]
-                # escape quote characters
-                element['value'] = element['value'].replace('"', '\\"').replace("'", "\\'")
-
-            if not element['display_name']:
-                element['display_name'] = element['name']
-            formatted = format_element_string(element['name'], element['selector'],
-                                              element['value'], element['display_name'])
-            f.write(formatted)
-        for func in functions:
-            f.write('\n\n' + func)
+        f.write(''.join(content))
 
 
 def edit_page_code(project, page_name, content):
@@ -122,6 +127,21 @@ class Page(BaseProjectElement):
 
     element_type = 'page'
 
+    _module = None
+
+    def get_module(self):
+        if self._module is None:
+            self._module = self.module
+        return self._module
+
+    def import_module(self):
+        """Import the page module.
+        Returns a (module, error) tuple. The module is kept
+        so `components` does not need to import it again.
+        """
+        self._module, error = utils.import_module(self.path)
+        return self._module, error
+
     @property
     def components(self):
         """Parses a page and returns its components as a dictionary.
@@ -154,7 +174,7 @@ class Page(BaseProjectElement):
             'code_lines': [],
             'source_code': ''
         }
-        module = self.module
+        module = self.get_module()
         components['source_code'] = self.code
         components['code_lines'] = components['source_code'].split('\n')
 
@@ -170,9 +190,11 @@ class Page(BaseProjectElement):
                 if result:
                     components['import_lines'] += result
 
-        ast_module_node = parsing_utils.ast_parse_file(self.path)
-        local_functions = parsing_utils.top_level_functions(ast_module_node)
-        local_assignments = parsing_utils.top_level_assignments(ast_module_node)
+        # reuse the source already read instead of reading the file again
+        ast_module_node = parsing_utils.ast_parse_source(components['source_code'],
+                                                         filename=self.path)
+        local_functions = set(parsing_utils.top_level_functions(ast_module_node))
+        local_assignments = set(parsing_utils.top_level_assignments(ast_module_node))
 
         # get all the names of the module,
         # ignoring the ones starting with '_'
@@ -182,7 +204,7 @@ class Page(BaseProjectElement):
             variable = getattr(module, var_name)
             if isinstance(variable, types.FunctionType) and var_name in local_functions:
                 # function
-                partial_name = '{}.{}'.format(self.name.split('.')[-1], var_name)
+                partial_name = '{}.{}'.format(self.stem_name, var_name)
                 function = {
                     'name': var_name,
                     'partial_name': partial_name,
@@ -198,14 +220,14 @@ class Page(BaseProjectElement):
                     display_name = ''
                     if len(variable) >= 3:
                         display_name = variable[2]
-                    partial_name = '{}.{}'.format(self.name.split('.')[-1], var_name)
+                    partial_name = '{}.{}'.format(self.stem_name, var_name)
                     element = {
                         'name': var_name,
                         'selector': variable[0],
                         'value': variable[1],
                         'display_name': display_name,
                         'partial_name': partial_name,
-                        'full_name': ''.join([self.name, '.', var_name])
+                        'full_name': '{}.{}'.format(self.name, var_name)
                     }
                     components['elements'].append(element)
             else:
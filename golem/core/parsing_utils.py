@@ -6,7 +6,15 @@ def ast_parse_file(filename):
     Returns a ast.Module node
     """
     with open(filename, "rt", encoding='utf-8') as file:
-        return ast.parse(file.read(), filename=filename)
+        return ast_parse_source(file.read(), filename=filename)
+
+
+def ast_parse_source(source, filename='<unknown>'):
+    """Parse a string of Python source code using ast.
+    Use it when the file content was already read.
+    Returns a ast.Module node
+    """
+    return ast.parse(source, filename=filename)
 
 
 def top_level_functions(ast_node):
@@ -18,11 +26,13 @@ def top_level_assignments(ast_node):
     """Given an ast Module node,
     return the names of the top level assignments.
     e.g.: "foo = 2" -> returns ['foo']
+    Assignments to attributes, subscripts or multiple
+    targets (e.g.: "a.b = 2", "a, b = 1, 2") are ignored.
     https://greentreesnakes.readthedocs.io/en/latest/nodes.html#Assign
     """
     assignments = []
     for v in ast_node.body:
-        if type(v) == ast.Assign:
-            if len(v.targets) == 1:
+        if isinstance(v, ast.Assign) and len(v.targets) == 1:
+            if isinstance(v.targets[0], ast.Name):
                 assignments.append(v.targets[0].id)
     return assignments
@@ -119,10 +119,13 @@ class Suite(BaseProjectElement):
     element_type = 'suite'
 
     _module = None
+    _module_imported = False
 
     def get_module(self):
-        if not self._module:
+        # import only once, even if the suite module has errors
+        if not self._module_imported:
             self._module = self.module
+            self._module_imported = True
         return self._module
 
     @property
@@ -158,7 +161,7 @@ class Suite(BaseProjectElement):
                 if test.endswith('.*'):
                     this_dir = test[:-2]
                     path = os.path.join(self.project.test_directory_path,
-                                        os.sep.join(this_dir.split('.')))
+                                        *this_dir.split('.'))
                     this_dir_tests = file_manager.get_files_dot_path(path, extension='.py')
                     this_dir_tests = ['{}.{}'.format(this_dir, x) for x in this_dir_tests]
                     tests = tests + this_dir_tests
@@ -99,7 +99,7 @@ def get_test_tags(project, full_test_case_name):
     result = []
     tc_name, parents = utils.separate_file_from_parents(full_test_case_name)
     path = os.path.join(session.testdir, 'projects', project, 'tests',
-                        os.sep.join(parents), '{}.py'.format(tc_name))
+                        *parents, '{}.py'.format(tc_name))
     test_module, _ = utils.import_module(path)
 
     if hasattr(test_module, 'tags'):
@@ -131,7 +131,7 @@ def get_tests_tags(project, tests):
     for test in tests:
         tc_name, parents = utils.separate_file_from_parents(test)
         path = os.path.join(session.testdir, 'projects', project, 'tests',
-                            os.sep.join(parents), '{}.py'.format(tc_name))
+                            *parents, '{}.py'.format(tc_name))
         last_modified_time = os.path.getmtime(path)
         if test in cache_tags:
             cache_timestamp = cache_tags[test]['timestamp']
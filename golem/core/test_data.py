@@ -17,7 +17,7 @@ def save_external_test_data_file(project, full_test_case_name, test_data):
     """
     tc_name, parents = utils.separate_file_from_parents(full_test_case_name)
     data_path_tests_folder = os.path.join(session.testdir, 'projects', project,
-                                          'tests', os.sep.join(parents))
+                                          'tests', *parents)
     data_file_path = os.path.join(data_path_tests_folder, '{}.csv'.format(tc_name))
     if os.path.isfile(data_file_path) or test_data:
         # update data file only if it already exists or there's data
@@ -37,7 +37,7 @@ def get_external_test_data(project, full_test_case_name):
     data_list = []
     test, parents = utils.separate_file_from_parents(full_test_case_name)
     data_file_path = os.path.join(session.testdir, 'projects', project, 'tests',
-                                  os.sep.join(parents), '{}.csv'.format(test))
+                                  *parents, '{}.csv'.format(test))
     if os.path.isfile(data_file_path):
         with open(data_file_path, 'r', encoding='utf-8') as csv_file:
             dict_reader = csv.DictReader(csv_file)
@@ -52,7 +52,7 @@ def get_internal_test_data(project, full_test_case_name, repr_strings=False):
     data_list = []
     tc_name, parents = utils.separate_file_from_parents(full_test_case_name)
     path = os.path.join(session.testdir, 'projects', project, 'tests',
-                        os.sep.join(parents), '{}.py'.format(tc_name))
+                        *parents, '{}.py'.format(tc_name))
     test_module, _ = utils.import_module(path)
 
     if hasattr(test_module, 'data'):
@@ -109,7 +109,7 @@ def remove_csv_if_exists(project, full_test_case_name):
     """Remove csv data file from tests/ folder"""
     tc_name, parents = utils.separate_file_from_parents(full_test_case_name)
     data_file_path_tests_folder = os.path.join(session.testdir, 'projects', project,
-                                               'tests', os.sep.join(parents),
+                                               'tests', *parents,
                                                '{}.csv'.format(tc_name))
     if os.path.isfile(data_file_path_tests_folder):
         os.remove(data_file_path_tests_folder)
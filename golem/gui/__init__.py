@@ -4,6 +4,7 @@ import sys
 
 from flask import Flask, g, render_template
 from flask_login import current_user, LoginManager
+from jinja2 import FileSystemBytecodeCache
 
 import golem
 from . import gui_utils, user_management
@@ -36,6 +37,8 @@ def create_app():
     app.register_blueprint(report_bp)
     app.register_blueprint(api_bp)
     app.jinja_env.globals['get_user_projects'] = gui_utils.ProjectsCache.get_user_projects
+    # store compiled templates so they are not compiled again on each start
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
 
     @login_manager.user_loader
     def load_user(user_id):
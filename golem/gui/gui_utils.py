@@ -313,7 +313,9 @@ class ProjectsCache:
 
     @staticmethod
     def get_user_projects():
-        return [p for p in ProjectsCache.get() if p in current_user.project_list ]
+        # project_list can list the test directory, compute it only once
+        user_projects = frozenset(current_user.project_list)
+        return [p for p in ProjectsCache.get() if p in user_projects]
 
     @staticmethod
     def add(project_name):
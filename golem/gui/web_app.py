@@ -164,7 +164,7 @@ def page_view(project, page_name, no_sidebar=False):
     page = Page(project, page_name)
     if not page.exists:
         abort(404, 'The page {} does not exist'.format(page_name))
-    _, error = utils.import_module(page.path)
+    _, error = page.import_module()
     if error:
         if no_sidebar:
             url = url_for('webapp.page_code_view_no_sidebar', project=project,
@@ -204,7 +204,7 @@ def page_code_view(project, page_name, no_sidebar=False):
     page = Page(project, page_name)
     if not page.exists:
         abort(404, 'The page {} does not exist'.format(page_name))
-    _, error = utils.import_module(page.path)
+    _, error = page.import_module()
     return render_template('page_builder/page_code.html', project=project,
                            page_object_code=page.code, page_name=page_name,
                            error=error, no_sidebar=no_sidebar)
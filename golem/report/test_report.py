@@ -147,7 +147,6 @@ def _get_test_log(project, execution, timestamp, test, set_name='', level='DEBUG
         with open(logpath, encoding='utf-8') as log_file:
             return log_file.read().splitlines()
     else:
-        print('Log file {} not found'.format(logpath))
         return None
 
 
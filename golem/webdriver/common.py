@@ -1,5 +1,6 @@
 import time
 
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
 from golem import execution
@@ -9,31 +10,33 @@ from golem.core.exceptions import (IncorrectSelectorType,
 # from golem.webdriver.extended_webelement import extend_webelement, ExtendedWebElement
 
 
+# Golem selector type -> Selenium locator strategy
+_SELECTOR_TYPES = {
+    'id': By.ID,
+    'css': By.CSS_SELECTOR,
+    'link_text': By.LINK_TEXT,
+    'partial_link_text': By.PARTIAL_LINK_TEXT,
+    'name': By.NAME,
+    'xpath': By.XPATH,
+    'tag_name': By.TAG_NAME
+}
+
+_XPATH_PREFIXES = ('/', './', '(', '../', '..', '*/')
+
+
 def _find_webelement(root, selector_type, selector_value, element_name,
                      timeout=0, wait_displayed=False, highlight=False):
     """Finds a web element."""
     webelement = None
+    by = _SELECTOR_TYPES.get(selector_type)
     remaining_time = lambda: timeout - (time.time() - start_time)
     start_time = time.time()
     while webelement is None:
         try:
-            if selector_type == 'id':
-                webelement = root.find_element_by_id(selector_value)
-            elif selector_type == 'css':
-                webelement = root.find_element_by_css_selector(selector_value)
-            elif selector_type == 'link_text':
-                webelement = root.find_element_by_link_text(selector_value)
-            elif selector_type == 'partial_link_text':
-                webelement = root.find_element_by_partial_link_text(selector_value)
-            elif selector_type == 'name':
-                webelement = root.find_element_by_name(selector_value)
-            elif selector_type == 'xpath':
-                webelement = root.find_element_by_xpath(selector_value)
-            elif selector_type == 'tag_name':
-                webelement = root.find_element_by_tag_name(selector_value)
-            else:
+            if by is None:
                 msg = 'Selector {} is not a valid option'.format(selector_type)
                 raise IncorrectSelectorType(msg)
+            webelement = root.find_element(by, selector_value)
             execution.logger.debug('Element found')
         except:
             if remaining_time() <= 0:
@@ -94,38 +97,17 @@ def _find(self, element=None, id=None, name=None, link_text=None, partial_link_t
         selector_value = element[1]
         element_name = element[2] if len(element) == 3 else element[1]
     elif isinstance(element, str):
-        if _str_is_xpath_selector(element):
-            selector_type = 'xpath'
-            selector_value = element
-            element_name = element
-        else:
-            selector_type = 'css'
-            selector_value = element
-            element_name = element
-    elif id:
-        selector_type = 'id'
-        selector_value = element_name = id
-    elif name:
-        selector_type = 'name'
-        selector_value = element_name = name
-    elif link_text:
-        selector_type = 'link_text'
-        selector_value = element_name = link_text
-    elif partial_link_text:
-        selector_type = 'partial_link_text'
-        selector_value = element_name = partial_link_text
-    elif css:
-        selector_type = 'css'
-        selector_value = element_name = css
-    elif xpath:
-        selector_type = 'xpath'
-        selector_value = element_name = xpath
-    elif tag_name:
-        selector_type = 'tag_name'
-        selector_value = element_name = tag_name
+        selector_type = 'xpath' if _str_is_xpath_selector(element) else 'css'
+        selector_value = element_name = element
     else:
-        raise IncorrectSelectorType('Selector is not a valid option')
-    
+        criteria = (('id', id), ('name', name), ('link_text', link_text),
+                    ('partial_link_text', partial_link_text), ('css', css),
+                    ('xpath', xpath), ('tag_name', tag_name))
+        selector_type, selector_value = _first_criteria(criteria)
+        if selector_type is None:
+            raise IncorrectSelectorType('Selector is not a valid option')
+        element_name = selector_value
+
     if not webelement:
         webelement = _find_webelement(self, selector_type, selector_value, element_name,
                                       timeout, wait_displayed, highlight)
@@ -152,71 +134,26 @@ def _find_all(self, element=None, id=None, name=None, link_text=None,
     """
     # TODO: avoid circular import
     from golem.webdriver.extended_webelement import extend_webelement
-    webelements = []
     tuple_element_name = None
     if isinstance(element, tuple):
         selector_type = element[0]
         selector_value = element[1]
         tuple_element_name = element[2] if len(element) >= 3 else element[1]
-        if selector_type == 'id':
-            id = selector_value
-        elif selector_type == 'css':
-            css = selector_value
-        elif selector_type == 'link_text':
-            link_text = selector_value
-        elif selector_type == 'partial_link_text':
-            partial_link_text = selector_value
-        elif selector_type == 'name':
-            name = selector_value
-        elif selector_type == 'xpath':
-            xpath = selector_value
-        elif selector_type == 'tag_name':
-            tag_name = selector_value
-        else:
+        if selector_type not in _SELECTOR_TYPES:
             raise Exception('Incorrect element {}'.format(element))
     elif isinstance(element, str):
-        if _str_is_xpath_selector(element):
-            xpath = element
-        else:
-            css = element
-
-    if id:
-        selector_type = 'id'
-        selector_value = id
-        element_name = tuple_element_name or id
-        webelements = self.find_elements_by_id(id)
-    elif css:
-        selector_type = 'css'
-        selector_value = css
-        element_name = tuple_element_name or css
-        webelements = self.find_elements_by_css_selector(css)
-    elif link_text:
-        selector_type = 'link_text'
-        selector_value = link_text
-        element_name = tuple_element_name or link_text
-        webelements = self.find_elements_by_link_text(link_text)
-    elif partial_link_text:
-        selector_type = 'partial_link_text'
-        selector_value = partial_link_text
-        element_name = tuple_element_name or partial_link_text
-        webelements = self.find_elements_by_partial_link_text(partial_link_text)
-    elif name:
-        selector_type = 'name'
-        selector_value = name
-        element_name = tuple_element_name or name
-        webelements = self.find_elements_by_name(name)
-    elif xpath:
-        selector_type = 'xpath'
-        selector_value = xpath
-        element_name = tuple_element_name or xpath
-        webelements = self.find_elements_by_xpath(xpath)
-    elif tag_name:
-        selector_type = 'tag_name'
-        selector_value = element_name = tag_name
-        element_name = tuple_element_name or tag_name
-        webelements = self.find_elements_by_tag_name(tag_name)
+        selector_type = 'xpath' if _str_is_xpath_selector(element) else 'css'
+        selector_value = element
     else:
+        criteria = (('id', id), ('css', css), ('link_text', link_text),
+                    ('partial_link_text', partial_link_text), ('name', name),
+                    ('xpath', xpath), ('tag_name', tag_name))
+        selector_type, selector_value = _first_criteria(criteria)
+
+    if selector_type is None or not selector_value:
         raise IncorrectSelectorType('Incorrect selector provided')
+    element_name = tuple_element_name or selector_value
+    webelements = self.find_elements(_SELECTOR_TYPES[selector_type], selector_value)
 
     extended_webelements = []
     for elem in webelements:
@@ -228,9 +165,15 @@ def _find_all(self, element=None, id=None, name=None, link_text=None,
     return extended_webelements
 
 
+def _first_criteria(criteria):
+    """Return the first (selector_type, selector_value) pair
+    of `criteria` with a value, or (None, None)
+    """
+    for selector_type, selector_value in criteria:
+        if selector_value:
+            return selector_type, selector_value
+    return None, None
+
+
 def _str_is_xpath_selector(selector):
-    options = ['/', './', '(', '../', '..', '*/']
-    for option in options:
-        if selector.startswith(option):
-            return True
-    return False
+    return selector.startswith(_XPATH_PREFIXES)
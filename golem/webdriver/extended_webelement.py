@@ -1,4 +1,5 @@
 from typing import List
+import re
 import time
 
 from selenium.webdriver.remote.webelement import WebElement as RemoteWebElement
@@ -14,6 +15,14 @@ from golem.webdriver.common import _find, _find_all
 from golem.webdriver import golem_expected_conditions as gec
 
 
+# valid key names for `press_key`, computed once
+_KEYS_MAP = {name: getattr(Keys, name) for name in dir(Keys) if not name.startswith('_')}
+_KEYS_VALID = ','.join(_KEYS_MAP)
+
+# input types that `check` can select
+_CHECKABLE_TYPES = frozenset(('checkbox', 'radio'))
+
+
 class ExtendedWebElement:
 
     selector_type = None
@@ -25,7 +34,7 @@ class ExtendedWebElement:
         If element is already checked, this is ignored.
         """
         checkbox_or_radio = (self.tag_name == 'input' and
-                             self.get_attribute('type') in ['checkbox', 'radio'])
+                             self.get_attribute('type') in _CHECKABLE_TYPES)
         if checkbox_or_radio:
             if not self.is_selected():
                 self.click()
@@ -35,6 +44,8 @@ class ExtendedWebElement:
 
     def double_click(self):
         """Double click the element"""
+        # ActionChains are not reused: selenium 3 keeps performed w3c actions
+        # and reset_actions() clears them with an extra request to the driver
         action_chains = ActionChains(self.parent)
         action_chains.double_click(self).perform()
 
@@ -138,14 +149,13 @@ class ExtendedWebElement:
           element.press_key('TAB')
           element.press_key('LEFT')
         """
-        if hasattr(Keys, key):
-            key_attr = getattr(Keys, key)
+        key_attr = _KEYS_MAP.get(key)
+        if key_attr is not None:
             self.send_keys(key_attr)
         else:
-            defined_keys = [name for name in dir(Keys) if not name.startswith('_')]
             error_msg = ('Key {} is invalid\n'
                          'valid keys are:\n'
-                         '{}'.format(key, ','.join(defined_keys)))
+                         '{}'.format(key, _KEYS_VALID))
             raise ValueError(error_msg)
 
     @property
@@ -163,10 +173,18 @@ class ExtendedWebElement:
         :Raises:
          - ValueError: if delay is not a positive int or float
         """
-        if not isinstance(delay, int) and not isinstance(delay, float):
+        if not isinstance(delay, (int, float)):
             raise ValueError('delay must be int or float')
         elif delay < 0:
             raise ValueError('delay must be a positive number')
+        elif value and self.parent.w3c:
+            # the first key is sent to the element to give it focus,
+            # the rest are sent in a single W3C actions request
+            self.send_keys(value[0])
+            action_chains = ActionChains(self.parent)
+            for c in value[1:]:
+                action_chains.pause(delay).send_keys(c)
+            action_chains.pause(delay).perform()
         else:
             for c in value:
                 self.send_keys(c)
@@ -339,61 +357,55 @@ def extend_webelement(web_element) -> ExtendedRemoteWebElement:
     return web_element
 
 
-HIGHLIGHT_ELEMENT_SCRIPT = """
-	let boundingRect = arguments[0].getBoundingClientRect();
-	boundingRect.left = boundingRect.left + window.scrollX;
-	boundingRect.top = boundingRect.top + window.scrollY;
-	if(isNaN(boundingRect.width)) {
-		boundingRect.width = 0;
-	}
-	if(isNaN(boundingRect.height)) {
-		boundingRect.height = 0;
-	}
-	
-	let borders = {
-		top: document.createElement('div'),
-		left: document.createElement('div'),
-		right: document.createElement('div'),
-		bottom: document.createElement('div'),
+def _minify_script(script):
+    """Collapse the whitespace of a Javascript snippet to reduce
+    the size of the payload sent to the browser.
+    The script must not rely on newlines, use semicolons and
+    block comments only.
+    """
+    return re.sub(r'\s+', ' ', script).strip()
+
+
+HIGHLIGHT_ELEMENT_SCRIPT = _minify_script("""
+	let element = arguments[0];
+	let rect = element.getBoundingClientRect();
+	let left = rect.left + window.scrollX;
+	let top = rect.top + window.scrollY;
+	let width = isNaN(rect.width) ? 0 : rect.width;
+	let height = isNaN(rect.height) ? 0 : rect.height;
+	let zIndex = parseInt(element.style.zIndex);
+
+	/* left, top, width and height of the top, left, right and bottom borders */
+	let borderBoxes = [
+		[left - 5, top - 5, width + 10, 4],
+		[left - 5, top - 5, 4, height + 10],
+		[left + width + 1, top - 5, 4, height + 10],
+		[left - 5, top + height + 1, width + 10, 4]
+	];
+
+	let borders = [];
+	for (const [boxLeft, boxTop, boxWidth, boxHeight] of borderBoxes) {
+		let border = document.createElement('div');
+		border.style.position = 'absolute';
+		border.style.backgroundColor = 'yellow';
+		border.style.left = boxLeft + 'px';
+		border.style.top = boxTop + 'px';
+		border.style.width = boxWidth + 'px';
+		border.style.height = boxHeight + 'px';
+		if(!Number.isNaN(zIndex)) {
+			border.style.zIndex = zIndex + 1;
+		}
+		document.body.appendChild(border);
+		borders.push(border);
 	}
 
-	Object.keys(borders).forEach(border => {
-		borders[border].style.position = 'absolute';
-		borders[border].style.backgroundColor = 'yellow';
-	});
-
-	borders.top.style.left = boundingRect.left - 5 + 'px';
-	borders.top.style.top = boundingRect.top - 5 + 'px';
-	borders.top.style.width = boundingRect.width + 10 + 'px';
-	borders.top.style.height = '4px';
-
-	borders.left.style.left = boundingRect.left - 5 + 'px';
-	borders.left.style.top = boundingRect.top - 5 + 'px';
-	borders.left.style.height = boundingRect.height + 10 + 'px';
-	borders.left.style.width = '4px';
-
-	borders.right.style.left = boundingRect.left + boundingRect.width + 1 + 'px';
-	borders.right.style.top = boundingRect.top - 5 + 'px';
-	borders.right.style.height = boundingRect.height + 10 + 'px';
-	borders.right.style.width = '4px';
-
-	borders.bottom.style.left = boundingRect.left - 5 + 'px';
-	borders.bottom.style.top = boundingRect.top + boundingRect.height + 1 + 'px';
-	borders.bottom.style.width = boundingRect.width + 10 + 'px';
-	borders.bottom.style.height = '4px';
-
-	let zIndex = parseInt(arguments[0].style.zIndex);
-	if(!Number.isNaN(zIndex)) {
-		Object.keys(borders).forEach(border => borders[border].style.zIndex = zIndex + 1);
-	}
-	Object.keys(borders).forEach(border => document.body.appendChild(borders[border]));
-	
 	setTimeout(() => {
-		Object.keys(borders).forEach(border => borders[border].style.backgroundColor = 'transparent');
+		borders.forEach(border => border.style.backgroundColor = 'transparent');
 	}, 300);
 	setTimeout(() => {
-		Object.keys(borders).forEach(border => borders[border].style.backgroundColor = 'yellow');
+		borders.forEach(border => border.style.backgroundColor = 'yellow');
 	}, 600);
 	setTimeout(() => {
-		Object.keys(borders).forEach(border => borders[border].remove());
-	}, 900);"""
\ No newline at end of file
+		borders.forEach(border => border.remove());
+	}, 900);
+""")
@@ -231,6 +231,27 @@ class TestPageCode:
         assert Page(project, 'does-not-exist').code is None
 
 
+class TestPageImportModule:
+
+    def test_page_import_module(self, project_session, test_utils):
+        _, project = project_session.activate()
+        page_name = test_utils.create_random_page(project)
+        page.edit_page_code(project, page_name, 'elem1 = ("id", "someId")\n')
+        page_obj = Page(project, page_name)
+        module, error = page_obj.import_module()
+        assert error is None
+        assert module.elem1 == ('id', 'someId')
+        assert page_obj.get_module() is module
+
+    def test_page_import_module_with_error(self, project_session, test_utils):
+        _, project = project_session.activate()
+        page_name = test_utils.create_random_page(project)
+        page.edit_page_code(project, page_name, 'elem1 = (\n')
+        module, error = Page(project, page_name).import_module()
+        assert module is None
+        assert 'SyntaxError' in error
+
+
 class TestPageComponents:
 
     def test_page_components(self, project_session, test_utils):
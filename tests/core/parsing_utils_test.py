@@ -11,6 +11,14 @@ class TestAstParseFile:
         assert isinstance(ast_node, ast.Module)
 
 
+class TestAstParseSource:
+
+    def test_ast_parse_source(self):
+        ast_node = parsing_utils.ast_parse_source('foo = 2\n')
+        assert isinstance(ast_node, ast.Module)
+        assert parsing_utils.top_level_assignments(ast_node) == ['foo']
+
+
 class TestTopLevelFunctions:
 
     def test_top_level_functions(self, dir_function, test_utils):
@@ -62,3 +70,14 @@ class TestTopLevelAssignments:
         ast_node = parsing_utils.ast_parse_file(filepath)
         assignments = parsing_utils.top_level_assignments(ast_node)
         assert assignments == ['foo', 'bar']
+
+    def test_top_level_assignments_ignore_non_name_targets(self):
+        content = ('foo = 2\n'
+                   'a, b = 1, 2\n'
+                   'foo.bar = 3\n'
+                   'baz = [1]\n'
+                   'baz[0] = 4\n'
+                   'x = y = 5\n')
+        ast_node = parsing_utils.ast_parse_source(content)
+        assignments = parsing_utils.top_level_assignments(ast_node)
+        assert assignments == ['foo', 'baz']
@@ -1,6 +1,6 @@
 import os
 
-from golem.core import suite
+from golem.core import suite, utils
 from golem.core.suite import Suite
 from golem.core.project import Project
 
@@ -210,6 +210,30 @@ class TestFormatListItems:
         assert output == expected
 
 
+class TestSuiteGetModule:
+
+    def test_suite_get_module_with_errors_is_imported_once(self, project_session,
+                                                            test_utils, monkeypatch):
+        _, project = project_session.activate()
+        suite_name = test_utils.create_random_suite(project)
+        suite.edit_suite_code(project, suite_name, 'processes = (\n')
+        imports = []
+        original_import_module = utils.import_module
+
+        def import_module_mock(path):
+            imports.append(path)
+            return original_import_module(path)
+
+        monkeypatch.setattr(utils, 'import_module', import_module_mock)
+        suite_obj = Suite(project, suite_name)
+        assert suite_obj.processes == 1
+        assert suite_obj.browsers == []
+        assert suite_obj.environments == []
+        assert suite_obj.tags == []
+        assert suite_obj.tests == []
+        assert len(imports) == 1
+
+
 class TestSuiteProcesses:
 
     def test_suite_processes(self, project_session, test_utils):